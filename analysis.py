@@ -4,7 +4,19 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from math import sqrt
-from typing import List, Dict, Any
+from typing import List, Dict, Sequence
+
+# Upper-exclusive category boundaries used by categorize_cgpa, and the label
+# for each of the len(CATEGORY_BINS) + 1 buckets they define.
+CATEGORY_BINS = np.array([2.0, 3.0, 3.5, 3.6, 3.8])
+CATEGORY_LABELS = (
+    "🔴 Very Low",
+    "🟠 Below 3.0",
+    "🟡 Safe Zone",
+    "🟢 Strong",
+    "🔵 Dean's List Range",
+    "💎 Near Perfection",
+)
 
 def categorize_cgpa(cgpa: float) -> str:
     """
@@ -24,127 +36,81 @@ def categorize_cgpa(cgpa: float) -> str:
     else:
         return "💎 Near Perfection"
 
-def summarize_statistics(final_values: List[float]) -> Dict[str, float]:
+def summarize_statistics(final_values: List[float],
+                         above: Sequence[float] = (3.5, 3.6)) -> Dict[str, float]:
     """
     Return a dictionary of extended statistical summaries
-    given an array of final CGPA values.
+    given an array of final CGPA values, including the share of
+    values strictly above each threshold in 'above' as "p_above_<t>".
     """
     if len(final_values) == 0:
         return {}
 
-    arr = np.array(final_values)
-    mean_val = np.mean(arr)
+    arr = np.ascontiguousarray(final_values, dtype=np.float64)
     n = len(arr)
+    # One sorted copy serves min/max, all three quantiles and the tail shares.
+    sorted_arr = np.sort(arr)
+    # Linear-interpolated quantiles (NumPy's default method) read straight
+    # off the sorted copy; np.quantile would partition the data again.
+    pos = np.array([0.25, 0.5, 0.75]) * (n - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    q25, median, q75 = (sorted_arr[lo] + (sorted_arr[hi] - sorted_arr[lo]) * (pos - lo)).tolist()
+    mean_val = arr.mean()
+    variance = arr.var(ddof=1)
+    std = sqrt(variance)
 
     # 95% Confidence Interval for the mean (approx. for demonstration)
     # Typically uses t-distribution for small n, but we keep it simple here.
-    std_err = np.std(arr, ddof=1) / sqrt(n)
+    std_err = std / sqrt(n)
     ci_lower = mean_val - 1.96 * std_err
     ci_upper = mean_val + 1.96 * std_err
 
-    return {
+    stats = {
         "count": n,
         "mean": mean_val,
-        "median": np.median(arr),
-        "std": np.std(arr, ddof=1),
-        "min": np.min(arr),
-        "max": np.max(arr),
-        "variance": np.var(arr, ddof=1),
-        "25th_percentile": np.percentile(arr, 25),
-        "75th_percentile": np.percentile(arr, 75),
+        "median": median,
+        "std": std,
+        "min": sorted_arr[0],
+        "max": sorted_arr[-1],
+        "variance": variance,
+        "25th_percentile": q25,
+        "75th_percentile": q75,
         "95ci_lower": ci_lower,
         "95ci_upper": ci_upper,
     }
+    above_counts = n - np.searchsorted(sorted_arr, above, side='right')
+    for threshold, count in zip(above, above_counts.tolist()):
+        stats[f"p_above_{threshold}"] = count / n
+    return stats
 
-def compute_category_counts(final_values: List[float]) -> Dict[str, int]:
+def categorize_cgpa_indices(final_values: List[float]) -> np.ndarray:
     """
-    Return the count of each CGPA category in the final results.
+    Vectorized categorize_cgpa: the index into CATEGORY_LABELS for every
+    value, computed in one searchsorted pass.
     """
-    counts = {
-        "🔴 Very Low": 0,
-        "🟠 Below 3.0": 0,
-        "🟡 Safe Zone": 0,
-        "🟢 Strong": 0,
-        "🔵 Dean's List Range": 0,
-        "💎 Near Perfection": 0,
-    }
-    for val in final_values:
-        cat = categorize_cgpa(val)
-        if cat in counts:
-            counts[cat] += 1
-        else:
-            # If a category not in dictionary, initialize
-            counts[cat] = 1
-    return counts
+    arr = np.asarray(final_values, dtype=np.float64)
+    return np.searchsorted(CATEGORY_BINS, arr, side='right')
 
-def create_plotly_table(table_data: List[List[Any]]) -> go.Figure:
+def compute_category_counts(final_values: List[float]) -> Dict[str, int]:
     """
-    Return a Plotly Table figure given table data.
-    Each item in table_data: [Path, Variation, Final CGPA, Job Prob, Insights, Category].
-    We'll do conditional coloring in the table cells based on category.
+    Return the count of each CGPA category in the final results.
+    Buckets all values in one vectorized pass instead of calling
+    categorize_cgpa per value.
     """
-    if not table_data:
-        # if no data, return an empty figure
-        return go.Figure(data=[go.Table(header=dict(values=[]), cells=dict(values=[]))])
-
-    # Transpose the table_data for Plotly
-    columns = list(zip(*table_data))  # Path, Variation, CGPA, JobProb, Insights, Category
-    # We'll do color mapping: e.g., color cell if category is certain
-    # category is the last item in columns
-    category_col = columns[-1]
-
-    # Build the fill_color array
-    fill_colors = []
-    for cat in category_col:
-        if "🔴" in cat:
-            fill_colors.append("rgb(255, 204, 204)")  # light red
-        elif "🟠" in cat:
-            fill_colors.append("rgb(255, 229, 204)")  # light orange
-        elif "🟡" in cat:
-            fill_colors.append("rgb(255, 255, 204)")  # light yellow
-        elif "🟢" in cat:
-            fill_colors.append("rgb(218, 240, 218)")  # light green
-        elif "🔵" in cat:
-            fill_colors.append("rgb(210, 233, 255)")  # light blue
-        elif "💎" in cat:
-            fill_colors.append("rgb(225, 225, 255)")  # slightly different pastel
-        else:
-            fill_colors.append("white")
-
-    # We'll apply a row-based approach for fill_color
-    # But we want the category column specifically colored.
-    # Approach: we color only the category column. The rest remain white or alternate row color.
-    # For simplicity, we'll fill entire row with the category color, or do stripes if desired.
-    # Let's do entire row color for emphasis:
-
-    fill_colors_by_row = []
-    for i, cat_color in enumerate(fill_colors):
-        fill_colors_by_row.append([cat_color]*len(columns))  # entire row same color
-
-    fig_table = go.Figure(data=[go.Table(
-        header=dict(
-            values=["Path", "Variation", "Final CGPA", "Job Prob(%)", "Insights", "Category"],
-            fill_color="rgb(180, 210, 255)",
-            align='center',
-            font=dict(color="black", size=12)
-        ),
-        cells=dict(
-            values=columns,
-            fill_color=fill_colors_by_row,
-            align='left',
-            font=dict(color="black", size=11)
-        )
-    )])
-    fig_table.update_layout(width=800, height=600)
-    return fig_table
+    idx = categorize_cgpa_indices(final_values)
+    counts_arr = np.bincount(idx, minlength=len(CATEGORY_LABELS))
+    return dict(zip(CATEGORY_LABELS, counts_arr.tolist()))
 
-def generate_category_distribution_bar(final_values: List[float]) -> go.Figure:
+def generate_category_distribution_bar(counts: List[int]) -> go.Figure:
     """
     Create a bar chart that displays how many CGPAs fall into each category.
+    `counts` holds one count per entry of CATEGORY_LABELS, e.g. from
+    np.bincount over categorize_cgpa_indices, so callers that have already
+    bucketed their values don't classify them a second time.
     """
-    cat_counts = compute_category_counts(final_values)
-    categories = list(cat_counts.keys())
-    counts = list(cat_counts.values())
+    categories = list(CATEGORY_LABELS)
+    counts = np.asarray(counts).tolist()
 
     fig_bar = go.Figure(data=[go.Bar(x=categories, y=counts, text=counts, textposition='auto')])
     fig_bar.update_layout(
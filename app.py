@@ -1,75 +1,511 @@
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import seaborn as sns
 import streamlit as st
 import io
-from reportlab.pdfgen import canvas
-from rich.console import Console
-import random
 
 # --------------------------------------------------------------------------
-# Import path functions which expect a 'start' CGPA, steps, seed,
-# and potentially a 'param' (if supported). Each function returns a list
-# of single-semester GPAs (0-4).
+# Import batched path functions which expect a 'start' CGPA, steps, the
+# number of trajectories 'n' and a numpy Generator 'rng'. Each function
+# returns an (n, steps) array of single-semester GPAs (0-4).
 # --------------------------------------------------------------------------
 from paths import (
-    generate_balanced_growth,
-    generate_high_achiever,
-    generate_downfall_recovery,
-    generate_up_down,
-    generate_perfectionist,
-    generate_consistent_improvement,
-    generate_chaotic,
-    generate_late_bloomer,
-    generate_spike_plateau,
-    generate_senioritis,
-    generate_no_study,
-    generate_burnout,
-    generate_triumph_over_adversity
+    ALL_PATHS,
+    PATH_SEEDS,
+    generate_balanced_growth_batch,
+    generate_high_achiever_batch,
+    generate_downfall_recovery_batch,
+    generate_up_down_batch,
+    generate_perfectionist_batch,
+    generate_consistent_improvement_batch,
+    generate_chaotic_batch,
+    generate_late_bloomer_batch,
+    generate_spike_plateau_batch,
+    generate_senioritis_batch,
+    generate_no_study_batch,
+    generate_burnout_batch,
+    generate_triumph_over_adversity_batch
 )
 
 from analysis import (
     summarize_statistics,
-    create_plotly_table,
-    categorize_cgpa,
-    generate_category_distribution_bar
+    categorize_cgpa_indices,
+    generate_category_distribution_bar,
+    CATEGORY_LABELS
 )
 from plotting import (
+    join_with_gaps,
+    scatter_trace_class,
+    sample_indices,
+    hex_to_rgb,
+    DETAIL_VARIATION_LIMIT,
     create_histogram,
     create_box_plot,
     create_pie_chart
 )
 
-sns.set_theme(style="darkgrid")
-console = Console()
+PATH_MAP = {
+    "Balanced Growth": generate_balanced_growth_batch,
+    "High Achiever": generate_high_achiever_batch,
+    "Downfall & Recovery": generate_downfall_recovery_batch,
+    "Up & Down": generate_up_down_batch,
+    "Perfectionist": generate_perfectionist_batch,
+    "Consistent Improve": generate_consistent_improvement_batch,
+    "Chaotic": generate_chaotic_batch,
+    "Late Bloomer": generate_late_bloomer_batch,
+    "Spike Plateau": generate_spike_plateau_batch,
+    "Senioritis": generate_senioritis_batch,
+    "No Study": generate_no_study_batch,
+    "Burnout": generate_burnout_batch,
+    "Triumph Over Adversity": generate_triumph_over_adversity_batch
+}
+
+BASE_STYLES = {
+    "Balanced Growth": {"color": "#0000FF", "dash": "solid"},
+    "High Achiever": {"color": "#008000", "dash": "dash"},
+    "Downfall & Recovery": {"color": "#FF0000", "dash": "dot"},
+    "Up & Down": {"color": "#FFA500", "dash": "dashdot"},
+    "Perfectionist": {"color": "#800080", "dash": "solid"},
+    "Consistent Improve": {"color": "#A52A2A", "dash": "dash"},
+    "Chaotic": {"color": "#FF00FF", "dash": "dot"},
+    "Late Bloomer": {"color": "#008080", "dash": "dashdot"},
+    "Spike Plateau": {"color": "#808080", "dash": "solid"},
+    "Senioritis": {"color": "#00FFFF", "dash": "dash"},
+    "No Study": {"color": "#FFD700", "dash": "dot"},
+    "Burnout": {"color": "#000080", "dash": "dashdot"},
+    "Triumph Over Adversity": {"color": "#DC143C", "dash": "solid"}
+}
+
+# Streamlit re-executes this script on every rerun; the derived style
+# table below is built once per server process and shared instead.
+@st.cache_resource
+def build_style_map():
+    """
+    BASE_STYLES plus the trace styling derived from it: the line of each
+    path's trajectories, and the outline and translucent fill of its
+    mass-mode range band.
+    """
+    style_map = {}
+    for name, style in BASE_STYLES.items():
+        rgb = hex_to_rgb(style["color"])
+        style_map[name] = dict(
+            style,
+            line=dict(color=style["color"], dash=style["dash"], width=2),
+            band_line=dict(color=style["color"], width=2),
+            fillcolor=f"rgba({rgb[0]},{rgb[1]},{rgb[2]},0.2)",
+        )
+    return style_map
+
+STYLE_MAP = build_style_map()
+
+# Per-path simulation caches keep this many entries each: every path of a
+# few recent slider settings, without letting a long session hold on to
+# every 5000-variation batch it ever generated.
+SIM_CACHE_ENTRIES = 64
+
+@st.cache_data(max_entries=SIM_CACHE_ENTRIES)
+def compute_trajectories_batch(path_name, start, steps, variations):
+    """
+    Return a (variations, steps) array of single-semester GPAs for one path.
+    Cached on plain values, so Streamlit reruns with unchanged inputs skip
+    generation entirely. Kept in float64: rounding to float32 moves values
+    such as 3.6 just below the category and outcome boundaries.
+    """
+    rng = np.random.default_rng(PATH_SEEDS[path_name])
+    return PATH_MAP[path_name](start, steps, variations, rng)
+
+@st.cache_data(max_entries=SIM_CACHE_ENTRIES)
+def compute_cgpa_paths(path_name, start, semester, steps, variations, what_if_adjust):
+    """
+    Return (semester GPAs, cumulative CGPAs), both (variations, max(steps, 1)),
+    for one path after applying the what-if adjustment.
+    """
+    if steps == 0:
+        # Final semester: nothing left to simulate, so skip generation and
+        # end every trajectory at the current CGPA.
+        current = np.full((variations, 1), float(start))
+        return current, current
+    sem_gpas = compute_trajectories_batch(path_name, start=start, steps=steps,
+                                          variations=variations)
+    # st.cache_data hands back a fresh copy, so it can be adjusted in place.
+    sem_gpas += what_if_adjust
+    np.clip(sem_gpas, 0.0, 4.0, out=sem_gpas)
+    # Cumulative CGPA after each future semester, one row per variation:
+    # the running grade-point total over the running semester count. Built
+    # in one buffer, without a temporary per arithmetic step.
+    completed_semesters = np.arange(semester + 1, semester + sem_gpas.shape[1] + 1, dtype=float)
+    trajectories = np.cumsum(sem_gpas, axis=1)
+    trajectories += start * semester
+    trajectories /= completed_semesters
+    return sem_gpas, trajectories
+
+@st.cache_data(max_entries=SIM_CACHE_ENTRIES)
+def compute_band(path_name, start, semester, steps, variations, what_if_adjust):
+    """
+    Return the y outline of the min-max envelope of a path's CGPA
+    trajectories for the mass-mode range band: the upper edge left to
+    right, then the lower edge back. It pairs with band_outline_x() of the
+    plotted semesters. Cached on the same plain values as
+    compute_cgpa_paths, so reruns that only touch other widgets reuse it.
+    """
+    _, trajectories = compute_cgpa_paths(path_name, start, semester, steps,
+                                         variations, what_if_adjust)
+    width = trajectories.shape[1]
+    y_band = np.empty(2 * width, dtype=trajectories.dtype)
+    trajectories.max(axis=0, out=y_band[:width])
+    trajectories.min(axis=0, out=y_band[width:])
+    y_band[width:] = y_band[width:][::-1]
+    return y_band
+
+def band_outline_x(semesters):
+    """The semesters forward then backward, matching compute_band's y outline."""
+    width = len(semesters)
+    x_band = np.empty(2 * width, dtype=np.asarray(semesters).dtype)
+    x_band[:width] = semesters
+    x_band[width:] = x_band[:width][::-1]
+    return x_band
+
+# Final-CGPA buckets shared by the job-probability and advice lookups, so a
+# single searchsorted picks both. Upper bounds are exclusive.
+OUTCOME_BINS = np.array([2.5, 3.0, 3.5, 3.6, 3.8])
+JOB_PROBS = np.array([0.4, 0.5, 0.7, 0.85, 0.85, 0.95])
+ADVICE = (
+    "Focus on fundamentals.",
+    "Focus on fundamentals.",
+    "Strengthen projects/internships.",
+    "Aim for advanced courses.",
+    "Seek leadership roles.",
+    "Expand into R&D.",
+)
 
-def generate_semester_gpas(_func, start, steps, seed=None, param=0.0):
+def outcome_bucket(final_cgpa):
+    """Index into JOB_PROBS / ADVICE for a final CGPA or an array of them."""
+    return np.searchsorted(OUTCOME_BINS, final_cgpa, side='right')
+
+@st.cache_data(max_entries=SIM_CACHE_ENTRIES)
+def run_simulation(selected_paths, start, semester, steps, variations, what_if_adjust):
+    """
+    Return (final CGPAs, results DataFrame, category counts) for one set of
+    sidebar inputs. 'selected_paths' is a tuple, so the whole result is
+    cached: reruns that only touch display widgets skip building the table
+    and bucketing every final CGPA.
+    """
+    # Final CGPA of every trajectory, one block of 'variations' per path in
+    # selection order; the other result columns are derived from it below.
+    final_col = np.empty(len(selected_paths) * variations)
+    for path_index, path_name in enumerate(selected_paths):
+        _, trajectories = compute_cgpa_paths(path_name, start, semester, steps,
+                                             variations, what_if_adjust)
+        final_col[path_index * variations:(path_index + 1) * variations] = trajectories[:, -1]
+
+    path_col = np.repeat(np.array(selected_paths, dtype=object), variations)
+    var_col = np.tile(np.arange(1, variations + 1), len(selected_paths))
+    buckets = outcome_bucket(final_col)
+    advice_col = np.array(ADVICE, dtype=object)[buckets]
+    # Classify every final CGPA once; labels and category counts both derive
+    # from these bucket indices.
+    cat_idx = categorize_cgpa_indices(final_col)
+    cat_col = np.array(CATEGORY_LABELS, dtype=object)[cat_idx]
+    category_counts = np.bincount(cat_idx, minlength=len(CATEGORY_LABELS))
+
+    # Shared by the results table and the CSV/PDF exports.
+    df_results = pd.DataFrame({
+        "Path": path_col,
+        "Variation": var_col,
+        "Final CGPA": final_col,
+        "Job Prob(%)": JOB_PROBS[buckets] * 100,
+        "Advice": advice_col,
+        "Category": cat_col
+    })
+    return final_col, df_results, category_counts
+
+# Export caches keep the files of only a few recent result sets: each entry
+# is a whole CSV or PDF of up to 5000 rows per selected path.
+EXPORT_CACHE_ENTRIES = 4
+
+@st.cache_data(max_entries=EXPORT_CACHE_ENTRIES)
+def encode_csv(df):
+    """
+    CSV bytes for the download button, reused across reruns with the same
+    results. Numeric columns stay numeric and are formatted by the CSV writer.
     """
-    Generate single-semester GPAs for 'steps' future semesters using
-    the provided path function. Attempt to pass 'param' if supported,
-    otherwise call without it.
+    return df.to_csv(index=False, float_format="%.2f").encode('utf-8')
+
+# Rows shown in the results table before the user opts into the full set.
+TABLE_PREVIEW_ROWS = 500
+# The results keep numeric columns numeric; the table formats them for display.
+RESULT_COLUMN_CONFIG = {
+    "Final CGPA": st.column_config.NumberColumn(format="%.2f"),
+    "Job Prob(%)": st.column_config.NumberColumn(format="%.1f%%"),
+}
+
+# Above this many result rows the PDF carries a per-path summary instead of
+# every row; a 5000-variation run would otherwise be a ~100-page table.
+PDF_ROW_LIMIT = 2000
+# Rows per Table flowable in the PDF. ReportLab re-splits the remainder of
+# a table at every page break, so one long table costs more than a run of
+# shorter ones.
+PDF_TABLE_ROWS = 500
+
+@st.cache_data(max_entries=EXPORT_CACHE_ENTRIES)
+def build_pdf(df):
     """
-    try:
-        return _func(start, steps=steps, seed=seed, param=param)
-    except TypeError:
-        return _func(start, steps=steps, seed=seed)
-
-def estimate_job_probability(final_cgpa):
-    if final_cgpa < 2.5:
-        return 0.4
-    elif final_cgpa < 3.0:
-        return 0.5
-    elif final_cgpa < 3.5:
-        return 0.7
-    elif final_cgpa < 3.8:
-        return 0.85
+    PDF report of the results table, laid out as ReportLab Table flowables
+    of PDF_TABLE_ROWS rows that paginate and repeat the header on each
+    page. Column widths are measured once over the distinct cell values
+    rather than per cell by every table. Results longer than PDF_ROW_LIMIT
+    are summarized per path, pointing to the CSV for the full table.
+    ReportLab is imported here so it only loads when a PDF is requested.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
+
+    styles = getSampleStyleSheet()
+    story = [Paragraph("CGPA Simulation Results", styles["Title"])]
+    if len(df) > PDF_ROW_LIMIT:
+        summary = (
+            df["Final CGPA"].astype(float)
+            .groupby(df["Path"], sort=False)
+            .agg(["count", "mean", "min", "max"])
+        )
+        story.append(Paragraph(
+            f"{len(df)} results are summarized per path below; "
+            "download the CSV for every row.", styles["Normal"]
+        ))
+        header = ["Path", "Trajectories", "Mean CGPA", "Min CGPA", "Max CGPA"]
+        rows = [
+            [path, count, f"{mean:.2f}", f"{lo:.2f}", f"{hi:.2f}"]
+            for path, count, mean, lo, hi in summary.itertuples()
+        ]
+    else:
+        header = list(df.columns)
+        rows = df.assign(**{
+            "Final CGPA": df["Final CGPA"].map("{:.2f}".format),
+            "Job Prob(%)": df["Job Prob(%)"].map("{:.1f}%".format),
+        }).values.tolist()
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, leftMargin=36, rightMargin=36)
+    # Widest cell per column plus the default 6pt padding on either side.
+    col_widths = [
+        max([stringWidth(str(name), "Helvetica-Bold", 8)]
+            + [stringWidth(value, "Helvetica", 8) for value in {str(row[j]) for row in rows}]) + 12
+        for j, name in enumerate(header)
+    ]
+    table_style = TableStyle([
+        ("FONT", (0, 0), (-1, -1), "Helvetica", 8),
+        ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 8),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+    ])
+    for i in range(0, max(len(rows), 1), PDF_TABLE_ROWS):
+        table = Table([header] + rows[i:i + PDF_TABLE_ROWS], colWidths=col_widths, repeatRows=1)
+        table.setStyle(table_style)
+        story.append(table)
+    doc.build(story)
+    return buffer.getvalue()
+
+# The results table and the export buttons run as fragments: toggling the
+# full table or requesting the PDF reruns only that block, not the whole
+# simulation and every chart.
+@st.fragment
+def render_results_table(df):
+    # Large result sets show a preview unless asked for, so each rerun
+    # doesn't serialize every row to the browser.
+    if len(df) > TABLE_PREVIEW_ROWS and not st.checkbox(
+            f"Show all {len(df)} rows", value=False):
+        st.caption(f"Showing the first {TABLE_PREVIEW_ROWS} rows; "
+                   "the CSV export below has every row.")
+        st.dataframe(df.head(TABLE_PREVIEW_ROWS), width="stretch",
+                     hide_index=True, column_config=RESULT_COLUMN_CONFIG)
     else:
-        return 0.95
+        st.dataframe(df, width="stretch", hide_index=True,
+                     column_config=RESULT_COLUMN_CONFIG)
+
+@st.fragment
+def render_exports(df):
+    st.download_button(
+        "Download CSV",
+        data=encode_csv(df),
+        file_name="cgpa_simulation_results.csv",
+        mime="text/csv"
+    )
 
-def hex_to_rgb(hex_color):
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+    if st.button("Download as PDF"):
+        st.download_button(
+            "Download PDF",
+            data=build_pdf(df),
+            file_name="cgpa_simulation_results.pdf",
+            mime="application/pdf"
+        )
+
+@st.cache_data(max_entries=SIM_CACHE_ENTRIES)
+def build_trajectory_traces(selected_paths, start, semester, steps,
+                            variations, what_if_adjust, drawn_lines, future_semesters):
+    """
+    Trace dicts for the Tab 2 trajectory figure: up to 'drawn_lines' CGPA
+    lines per path, plus a min-max range band when not every trajectory is
+    drawn. 'selected_paths' is a tuple. Cached, so reruns with the same
+    simulation inputs skip assembling the gap-joined line arrays; only the
+    figure wrapper is rebuilt.
+    """
+    traces = []
+    # Every path shares the same semesters and variation count, so the
+    # x values of the line traces and of the range bands are built once.
+    show_band = drawn_lines < variations and variations > 1
+    if show_band:
+        band_x = band_outline_x(future_semesters)
+    if drawn_lines:
+        line_x = join_with_gaps(np.tile(future_semesters, (drawn_lines, 1)))
+
+    for path_name in selected_paths:
+        path_style = STYLE_MAP[path_name]
+        cgpa_args = (path_name, start, semester, steps, variations, what_if_adjust)
+        all_sem_gpas, all_trajectories = compute_cgpa_paths(*cgpa_args)
+
+        if drawn_lines:
+            # The drawn variations of a path go into one trace, separated by
+            # NaN gaps, so the browser lays out one line per path instead of
+            # one per variation; large batches switch to WebGL rendering.
+            if drawn_lines <= DETAIL_VARIATION_LIMIT:
+                detail = dict(
+                    mode='lines+markers',
+                    customdata=join_with_gaps(all_sem_gpas[:drawn_lines]),
+                    hovertemplate=(
+                        "Semester: %{x}<br>"
+                        "Cumulative CGPA: %{y:.2f}<br>"
+                        "Single-Sem GPA: %{customdata:.2f}<br>"
+                        "<extra>%{fullData.name}</extra>"
+                    ),
+                )
+            else:
+                detail = dict(
+                    mode='lines',
+                    hovertemplate=(
+                        "Semester: %{x}<br>"
+                        "Cumulative CGPA: %{y:.2f}<br>"
+                        "<extra>%{fullData.name}</extra>"
+                    ),
+                )
+            lines = all_trajectories[:drawn_lines]
+            traces.append(scatter_trace_class(lines.size)(
+                x=line_x,
+                y=join_with_gaps(lines),
+                name=path_name,
+                line=path_style["line"],
+                **detail
+            ).to_plotly_json())
+
+        if show_band:
+            traces.append(go.Scatter(
+                x=band_x,
+                y=compute_band(*cgpa_args),
+                fill='toself',
+                name=f"{path_name} Range",
+                mode='lines',
+                line=path_style["band_line"],
+                fillcolor=path_style["fillcolor"],
+                hoverinfo='skip',
+                showlegend=True
+            ).to_plotly_json())
+    return traces
+
+# Static layout of the trajectory figure, shared by every rerun.
+TRAJECTORY_LAYOUT = dict(
+    title="CGPA Evolution with Multiple Paths & Custom Parameters",
+    xaxis_title="Semester",
+    yaxis_title="Cumulative CGPA",
+    hovermode="closest",
+    transition_duration=500,
+    template="plotly_white"
+)
+
+def build_trajectory_figure(traces):
+    """Wrap the cached trajectory traces in the static layout."""
+    # Build the figure once from all traces; the layout is validated once
+    # instead of on every add_trace call.
+    fig = go.Figure(data=traces, layout=TRAJECTORY_LAYOUT)
+    fig.add_hline(
+        y=3.6,
+        line_dash="dash",
+        line_color="gray",
+        annotation_text="Dean's List (3.6)",
+        annotation_position="bottom right"
+    )
+    return fig
+
+# Tab 1 path descriptions, stored already dedented outside main().
+PATH_INFO_MD = """\
+Below, you’ll find detailed explanations of each academic path, 
+along with real-world examples illustrating what might cause 
+a student to follow that path.
+
+**1. Balanced Growth**  
+*Steady, incremental improvement each semester.*  
+- **Academic Behavior**: Consistent study routines, gradually taking on more challenging material.  
+- **Real-World Example**: A student who steadily improves by dedicating a few extra hours each week to coursework, gradually raising their grades through persistent effort without extreme peaks or troughs.
+
+**2. High Achiever**  
+*Consistently top performance from the start.*  
+- **Academic Behavior**: Exceptional discipline, strong grasp of concepts, active participation, and thorough exam preparation.  
+- **Real-World Example**: A student enters college with advanced knowledge and excels due to rigorous study habits and strong motivation.
+
+**3. Downfall & Recovery**  
+*A dip in performance followed by a strong bounce back.*  
+- **Academic Behavior**: Initial high grades, a period of decline due to external factors, followed by recovery.  
+- **Real-World Example**: A student struggles with personal issues mid-course causing grades to drop, then overcomes these challenges and improves.
+
+**4. Up & Down**  
+*Fluctuating academic performance.*  
+- **Academic Behavior**: Irregular study patterns, varying course difficulties, swings in motivation.  
+- **Real-World Example**: A student performs well in some semesters when motivated and struggles in others due to distractions or tougher courses.
+
+**5. Perfectionist**  
+*Strives for flawless performance with occasional setbacks.*  
+- **Academic Behavior**: High expectations lead to meticulous study, but stress may cause performance dips.  
+- **Real-World Example**: A student aiming for perfect scores may experience burnout or anxiety, impacting some results despite strong efforts.
+
+**6. Consistent Improve**  
+*Slow but steady academic improvement.*  
+- **Academic Behavior**: Gradual refinement of study techniques, consistently better understanding and grades over time.  
+- **Real-World Example**: A student learns to manage time better each year, seeks help when needed, and steadily raises their GPA.
+
+**7. Chaotic**  
+*Highly unpredictable performance.*  
+- **Academic Behavior**: Erratic study habits, external factors causing varying levels of engagement.  
+- **Real-World Example**: A student juggling work, family, or health issues produces inconsistent grades with no clear trend.
+
+**8. Late Bloomer**  
+*Starts slow, then significantly improves.*  
+- **Academic Behavior**: Initial difficulties adjusting, followed by effective learning strategies and passion for subjects.  
+- **Real-World Example**: A freshman struggles initially but discovers strong study routines or a field of interest, leading to a dramatic GPA increase in later years.
+
+**9. Spike Plateau**  
+*Early high performance that levels off.*  
+- **Academic Behavior**: Strong start with high grades, then maintenance without further improvement.  
+- **Real-World Example**: A student excels early due to strong preparation but eventually reaches a performance ceiling as courses become more challenging, maintaining GPA without further spikes.
+
+**10. Senioritis**  
+*Declining performance in later semesters.*  
+- **Academic Behavior**: Reduced effort and engagement as graduation nears.  
+- **Real-World Example**: After securing job offers or grad school placements, a student’s motivation wanes, leading to a dip in academic performance.
+
+**11. No Study**  
+*Minimal academic effort over time.*  
+- **Academic Behavior**: Lack of engagement, poor time management, near-stagnant GPA.  
+- **Real-World Example**: A student who attends classes but does not study or complete assignments, resulting in consistently low grades.
+
+**12. Burnout**  
+*Sharp decline after initial success.*  
+- **Academic Behavior**: Overcommitment leads to exhaustion, health issues, and subsequent performance drop.  
+- **Real-World Example**: A student who pushes too hard initially experiences burnout, causing a sudden drop in GPA despite earlier high performance.
+
+**13. Triumph Over Adversity**  
+*Severe dip due to hardships, followed by overcoming challenges.*  
+- **Academic Behavior**: Faces significant obstacles, performance drops, then recovers and excels.  
+- **Real-World Example**: A student endures financial, personal, or health crises that lower grades but eventually overcomes these challenges with support, leading to a strong recovery in academic performance.
+"""
 
 def main():
     # ----------------------------------------------------------------
@@ -91,16 +527,18 @@ def main():
     st.sidebar.header("Simulation Configuration")
     mass_mode = st.sidebar.checkbox("Enable Mass Simulation Mode (Range Band)", value=False)
     variations = st.sidebar.slider("How many trajectories per path?", 1, 5000, 500 if mass_mode else 5)
+    # Individual lines drawn per path; any trajectories beyond them are
+    # still simulated and shown through the path's range band.
+    if mass_mode:
+        drawn_lines = 0
+    else:
+        drawn_lines = min(variations, st.sidebar.slider("Max lines drawn per path", 1, 5000, 50))
 
-    all_paths = [
-        "Balanced Growth", "High Achiever", "Downfall & Recovery", "Up & Down",
-        "Perfectionist", "Consistent Improve", "Chaotic", "Late Bloomer",
-        "Spike Plateau", "Senioritis", "No Study", "Burnout", "Triumph Over Adversity"
-    ]
-    path_params = {}
+    # No path function takes a custom parameter yet, so these inputs are not
+    # passed on to the simulation.
     with st.sidebar.expander("Custom Path Parameters"):
-        for p in all_paths:
-            path_params[p] = st.number_input(
+        for p in ALL_PATHS:
+            st.number_input(
                 f"{p} Param",
                 min_value=0.0,
                 max_value=10.0,
@@ -109,7 +547,7 @@ def main():
                 help=f"Custom parameter for {p}."
             )
 
-    selected_paths = st.sidebar.multiselect("Select paths to simulate:", options=all_paths, default=["Balanced Growth", "High Achiever"])
+    selected_paths = st.sidebar.multiselect("Select paths to simulate:", options=ALL_PATHS, default=["Balanced Growth", "High Achiever"])
 
     current_semester = st.sidebar.slider("Current Semester (1-10)", 1, 10, 1)
     current_cgpa = st.sidebar.slider("Current CGPA (0.0 - 4.0)", 0.0, 4.0, 2.91, 0.01)
@@ -125,398 +563,171 @@ def main():
     total_semesters = 10
     steps = max(total_semesters - current_semester, 0)
     future_semesters = np.arange(current_semester + 1, total_semesters + 1)
-
-    # ----------------------------------------------------------------
-    # PATH & STYLE MAPS
-    # ----------------------------------------------------------------
-    path_map = {
-        "Balanced Growth": generate_balanced_growth,
-        "High Achiever": generate_high_achiever,
-        "Downfall & Recovery": generate_downfall_recovery,
-        "Up & Down": generate_up_down,
-        "Perfectionist": generate_perfectionist,
-        "Consistent Improve": generate_consistent_improvement,
-        "Chaotic": generate_chaotic,
-        "Late Bloomer": generate_late_bloomer,
-        "Spike Plateau": generate_spike_plateau,
-        "Senioritis": generate_senioritis,
-        "No Study": generate_no_study,
-        "Burnout": generate_burnout,
-        "Triumph Over Adversity": generate_triumph_over_adversity
-    }
-    style_map = {
-        "Balanced Growth": {"color": "#0000FF", "dash": "solid"},
-        "High Achiever": {"color": "#008000", "dash": "dash"},
-        "Downfall & Recovery": {"color": "#FF0000", "dash": "dot"},
-        "Up & Down": {"color": "#FFA500", "dash": "dashdot"},
-        "Perfectionist": {"color": "#800080", "dash": "solid"},
-        "Consistent Improve": {"color": "#A52A2A", "dash": "dash"},
-        "Chaotic": {"color": "#FF00FF", "dash": "dot"},
-        "Late Bloomer": {"color": "#008080", "dash": "dashdot"},
-        "Spike Plateau": {"color": "#808080", "dash": "solid"},
-        "Senioritis": {"color": "#00FFFF", "dash": "dash"},
-        "No Study": {"color": "#FFD700", "dash": "dot"},
-        "Burnout": {"color": "#000080", "dash": "dashdot"},
-        "Triumph Over Adversity": {"color": "#DC143C", "dash": "solid"}
-    }
+    if steps == 0:
+        # Plot the final semester's CGPA as a single point.
+        future_semesters = np.array([current_semester])
 
     # ----------------------------------------------------------------
     # MAIN SIMULATION
     # ----------------------------------------------------------------
-    final_cgpas = []
-    fig = go.Figure()
-
-    for path_name in selected_paths:
-        all_trajectories = []
-
-        for variation_index in range(variations):
-            seed_val = (42 + hash(path_name) + variation_index) % (2 ** 32)
-            random.seed(seed_val)
-
-            future_sem_gpas = generate_semester_gpas(
-                _func=path_map[path_name],
-                start=current_cgpa,
-                steps=steps,
-                seed=seed_val,
-                param=path_params[path_name]
-            )
-
-            for i in range(len(future_sem_gpas)):
-                future_sem_gpas[i] = min(max(future_sem_gpas[i] + what_if_adjust, 0.0), 4.0)
-
-            cgpa_history = []
-            sem_history = []
-            current_gpa = current_cgpa
-            completed_semesters = current_semester
-
-            for single_sem_gpa in future_sem_gpas:
-                new_cgpa = ((current_gpa * completed_semesters) + single_sem_gpa) / (completed_semesters + 1)
-                cgpa_history.append(new_cgpa)
-                sem_history.append(single_sem_gpa)
-                current_gpa = new_cgpa
-                completed_semesters += 1
-
-            final_val = cgpa_history[-1] if cgpa_history else current_cgpa
-            cat = categorize_cgpa(final_val)
-            job_prob = estimate_job_probability(final_val)
-            advice = (
-                "Focus on fundamentals." if final_val < 3.0 else
-                "Strengthen projects/internships." if final_val < 3.5 else
-                "Aim for advanced courses." if final_val < 3.6 else
-                "Seek leadership roles." if final_val < 3.8 else
-                "Expand into R&D."
-            )
-
-            final_cgpas.append((path_name, variation_index + 1, final_val, cat, job_prob, advice))
-            all_trajectories.append(cgpa_history)
-
-            if not mass_mode:
-                custom_data = [f"{gpa:.2f}" for gpa in sem_history]
-                line_name = f"{path_name} Var {variation_index + 1}" if variation_index == 0 else None
-                fig.add_trace(go.Scatter(
-                    x=future_semesters,
-                    y=cgpa_history,
-                    mode='lines+markers',
-                    name=line_name,
-                    customdata=custom_data,
-                    hovertemplate=(
-                        "Semester: %{x}<br>"
-                        "Cumulative CGPA: %{y:.2f}<br>"
-                        "Single-Sem GPA: %{customdata}<br>"
-                        "<extra>%{fullData.name}</extra>"
-                    ),
-                    line=dict(
-                        color=style_map[path_name]["color"],
-                        dash=style_map[path_name]["dash"],
-                        width=2
-                    )
-                ))
-
-        if mass_mode and variations > 1:
-            all_trajectories = np.array(all_trajectories)
-            min_curve = np.min(all_trajectories, axis=0)
-            max_curve = np.max(all_trajectories, axis=0)
-            x_band = np.concatenate([future_semesters, future_semesters[::-1]])
-            y_band = np.concatenate([max_curve, min_curve[::-1]])
-            path_style = style_map[path_name]
-            rgb = hex_to_rgb(path_style["color"])
-            fig.add_trace(go.Scatter(
-                x=x_band,
-                y=y_band,
-                fill='toself',
-                name=f"{path_name} Range",
-                mode='lines',
-                line=dict(width=2, color=path_style["color"]),
-                fillcolor=f'rgba({rgb[0]},{rgb[1]},{rgb[2]},0.2)',
-                hoverinfo='skip',
-                showlegend=True
-            ))
-
-    fig.update_layout(
-        title="CGPA Evolution with Multiple Paths & Custom Parameters",
-        xaxis_title="Semester",
-        yaxis_title="Cumulative CGPA",
-        hovermode="closest",
-        transition_duration=500,
-        template="plotly_white"
-    )
-    fig.add_hline(
-        y=3.6,
-        line_dash="dash",
-        line_color="gray",
-        annotation_text="Dean's List (3.6)",
-        annotation_position="bottom right"
+    # The cached builders take the selection as a tuple.
+    selected_paths = tuple(selected_paths)
+    final_col, df_results, category_counts = run_simulation(
+        selected_paths, current_cgpa, current_semester, steps, variations,
+        what_if_adjust
     )
 
     # ----------------------------------------------------------------
     # TABS DEFINITION
     # ----------------------------------------------------------------
+    # Switching tabs reruns the script with only the selected tab's body
+    # executed, so charts of hidden tabs are not built on every rerun; the
+    # simulation itself comes back from the cache.
     tabs = st.tabs([
         "Path Information",
         "Interactive Graph",
         "Post-Simulation Analysis",
         "Distributions & Exports"
-    ])
+    ], key="main_tabs", on_change="rerun")
 
     # ----------------------------------------------------------------
     # TAB 1: Path Information with Detailed Examples
     # ----------------------------------------------------------------
     with tabs[0]:
-        st.header("Path Information & Real-World Examples")
-        st.markdown("""
-        Below, you’ll find detailed explanations of each academic path, 
-        along with real-world examples illustrating what might cause 
-        a student to follow that path.
-
-        **1. Balanced Growth**  
-        *Steady, incremental improvement each semester.*  
-        - **Academic Behavior**: Consistent study routines, gradually taking on more challenging material.  
-        - **Real-World Example**: A student who steadily improves by dedicating a few extra hours each week to coursework, gradually raising their grades through persistent effort without extreme peaks or troughs.
-
-        **2. High Achiever**  
-        *Consistently top performance from the start.*  
-        - **Academic Behavior**: Exceptional discipline, strong grasp of concepts, active participation, and thorough exam preparation.  
-        - **Real-World Example**: A student enters college with advanced knowledge and excels due to rigorous study habits and strong motivation.
-
-        **3. Downfall & Recovery**  
-        *A dip in performance followed by a strong bounce back.*  
-        - **Academic Behavior**: Initial high grades, a period of decline due to external factors, followed by recovery.  
-        - **Real-World Example**: A student struggles with personal issues mid-course causing grades to drop, then overcomes these challenges and improves.
-
-        **4. Up & Down**  
-        *Fluctuating academic performance.*  
-        - **Academic Behavior**: Irregular study patterns, varying course difficulties, swings in motivation.  
-        - **Real-World Example**: A student performs well in some semesters when motivated and struggles in others due to distractions or tougher courses.
-
-        **5. Perfectionist**  
-        *Strives for flawless performance with occasional setbacks.*  
-        - **Academic Behavior**: High expectations lead to meticulous study, but stress may cause performance dips.  
-        - **Real-World Example**: A student aiming for perfect scores may experience burnout or anxiety, impacting some results despite strong efforts.
-
-        **6. Consistent Improve**  
-        *Slow but steady academic improvement.*  
-        - **Academic Behavior**: Gradual refinement of study techniques, consistently better understanding and grades over time.  
-        - **Real-World Example**: A student learns to manage time better each year, seeks help when needed, and steadily raises their GPA.
-
-        **7. Chaotic**  
-        *Highly unpredictable performance.*  
-        - **Academic Behavior**: Erratic study habits, external factors causing varying levels of engagement.  
-        - **Real-World Example**: A student juggling work, family, or health issues produces inconsistent grades with no clear trend.
-
-        **8. Late Bloomer**  
-        *Starts slow, then significantly improves.*  
-        - **Academic Behavior**: Initial difficulties adjusting, followed by effective learning strategies and passion for subjects.  
-        - **Real-World Example**: A freshman struggles initially but discovers strong study routines or a field of interest, leading to a dramatic GPA increase in later years.
-
-        **9. Spike Plateau**  
-        *Early high performance that levels off.*  
-        - **Academic Behavior**: Strong start with high grades, then maintenance without further improvement.  
-        - **Real-World Example**: A student excels early due to strong preparation but eventually reaches a performance ceiling as courses become more challenging, maintaining GPA without further spikes.
-
-        **10. Senioritis**  
-        *Declining performance in later semesters.*  
-        - **Academic Behavior**: Reduced effort and engagement as graduation nears.  
-        - **Real-World Example**: After securing job offers or grad school placements, a student’s motivation wanes, leading to a dip in academic performance.
-
-        **11. No Study**  
-        *Minimal academic effort over time.*  
-        - **Academic Behavior**: Lack of engagement, poor time management, near-stagnant GPA.  
-        - **Real-World Example**: A student who attends classes but does not study or complete assignments, resulting in consistently low grades.
-
-        **12. Burnout**  
-        *Sharp decline after initial success.*  
-        - **Academic Behavior**: Overcommitment leads to exhaustion, health issues, and subsequent performance drop.  
-        - **Real-World Example**: A student who pushes too hard initially experiences burnout, causing a sudden drop in GPA despite earlier high performance.
-
-        **13. Triumph Over Adversity**  
-        *Severe dip due to hardships, followed by overcoming challenges.*  
-        - **Academic Behavior**: Faces significant obstacles, performance drops, then recovers and excels.  
-        - **Real-World Example**: A student endures financial, personal, or health crises that lower grades but eventually overcomes these challenges with support, leading to a strong recovery in academic performance.
-        """)
+        if tabs[0].open:
+            st.header("Path Information & Real-World Examples")
+            st.markdown(PATH_INFO_MD)
 
     # ----------------------------------------------------------------
     # TAB 2: Interactive Graph
     # ----------------------------------------------------------------
     with tabs[1]:
-        if mass_mode and variations > 100:
-            st.info("Showing range band for many lines. This might be computationally heavy!")
-        st.plotly_chart(fig, use_container_width=True)
+        if tabs[1].open:
+            if mass_mode and variations > 100:
+                st.info("Showing range band for many lines. This might be computationally heavy!")
+            traces = build_trajectory_traces(
+                selected_paths, current_cgpa, current_semester,
+                steps, variations, what_if_adjust, drawn_lines, future_semesters
+            )
+            fig = build_trajectory_figure(traces)
+            st.plotly_chart(fig, width="stretch")
 
     # ----------------------------------------------------------------
     # TAB 3: Post-Simulation Analysis
     # ----------------------------------------------------------------
     with tabs[2]:
-        table_data = []
-        final_values_only = []
-        for (p_name, var_idx, final_val, cat, job_prob, advice) in final_cgpas:
-            table_data.append([
-                p_name, var_idx, f"{final_val:.2f}",
-                f"{job_prob * 100:.1f}%", advice, cat
-            ])
-            final_values_only.append(final_val)
-
-        st.subheader("Post-Simulation Analysis")
-        fig_table = create_plotly_table(table_data)
-        st.plotly_chart(fig_table, use_container_width=True)
-
-        if final_values_only:
-            st.markdown("#### Violin Plot of Final CGPAs")
-            fig_violin = go.Figure()
-            fig_violin.add_trace(go.Violin(
-                y=final_values_only,
-                box_visible=True,
-                meanline_visible=True,
-                fillcolor='lightseagreen',
-                opacity=0.6,
-                line_color='darkblue',
-                name='Final CGPAs'
-            ))
-            fig_violin.update_layout(
-                xaxis_title="All Trajectories",
-                yaxis_title="Final CGPA",
-                template="plotly_white"
-            )
-            st.plotly_chart(fig_violin, use_container_width=True)
-
-            st.markdown("#### Scatter Plot of Final CGPAs")
-            var_indices = [var_idx for (_, var_idx, _, _, _, _) in final_cgpas]
-            fig_scatter = go.Figure(data=go.Scatter(
-                x=var_indices,
-                y=final_values_only,
-                mode='markers',
-                marker=dict(
-                    size=8,
-                    color=final_values_only,
-                    colorscale='Viridis',
-                    showscale=True
+        if tabs[2].open:
+            st.subheader("Post-Simulation Analysis")
+            render_results_table(df_results)
+
+            if final_col.size:
+                # Large runs are drawn from a fixed sample to keep the browser responsive.
+                shown = sample_indices(final_col.size)
+                st.markdown("#### Violin Plot of Final CGPAs")
+                fig_violin = go.Figure()
+                fig_violin.add_trace(go.Violin(
+                    y=final_col[shown],
+                    box_visible=True,
+                    meanline_visible=True,
+                    fillcolor='lightseagreen',
+                    opacity=0.6,
+                    line_color='darkblue',
+                    name='Final CGPAs'
+                ))
+                fig_violin.update_layout(
+                    xaxis_title="All Trajectories",
+                    yaxis_title="Final CGPA",
+                    template="plotly_white"
                 )
-            ))
-            fig_scatter.update_layout(
-                xaxis_title="Variation Index",
-                yaxis_title="Final CGPA",
-                template="plotly_white"
-            )
-            st.plotly_chart(fig_scatter, use_container_width=True)
-
-            st.markdown("#### Bar Chart of CGPA Categories")
-            categories = [categorize_cgpa(val) for val in final_values_only]
-            category_series = pd.Series(categories)
-            category_counts = category_series.value_counts().sort_index()
-            fig_bar = go.Figure(
-                data=go.Bar(
-                    x=category_counts.index,
-                    y=category_counts.values,
-                    marker_color='teal'
+                st.plotly_chart(fig_violin, width="stretch")
+
+                st.markdown("#### Scatter Plot of Final CGPAs")
+                fig_scatter = go.Figure(data=scatter_trace_class(final_col[shown].size)(
+                    x=df_results["Variation"].to_numpy()[shown],
+                    y=final_col[shown],
+                    mode='markers',
+                    marker=dict(
+                        size=8,
+                        color=final_col[shown],
+                        colorscale='Viridis',
+                        showscale=True
+                    )
+                ))
+                fig_scatter.update_layout(
+                    xaxis_title="Variation Index",
+                    yaxis_title="Final CGPA",
+                    template="plotly_white"
                 )
-            )
-            fig_bar.update_layout(
-                xaxis_title="CGPA Category",
-                yaxis_title="Count",
-                template="plotly_white"
-            )
-            st.plotly_chart(fig_bar, use_container_width=True)
-
-        st.markdown("### Extended Statistical Summary of Final CGPAs")
-        if final_values_only:
-            stats = summarize_statistics(final_values_only)
-            if stats:
-                st.write(f"**Count**: {stats['count']}")
-                st.write(f"**Mean**: {stats['mean']:.2f}")
-                st.write(f"**Median**: {stats['median']:.2f}")
-                st.write(f"**Std**: {stats['std']:.2f}")
-                st.write(f"**Variance**: {stats['variance']:.2f}")
-                st.write(f"**Min**: {stats['min']:.2f}")
-                st.write(f"**Max**: {stats['max']:.2f}")
-                st.write(f"**25th Percentile**: {stats['25th_percentile']:.2f}")
-                st.write(f"**75th Percentile**: {stats['75th_percentile']:.2f}")
-                if "95ci_lower" in stats and "95ci_upper" in stats:
-                    st.write(f"**95% CI**: ({stats['95ci_lower']:.2f}, {stats['95ci_upper']:.2f})")
-                arr = np.array(final_values_only)
-                st.write(f"**P(CGPA > 3.5)**: {np.mean(arr > 3.5) * 100:.2f}%")
-                st.write(f"**P(CGPA > 3.6)**: {np.mean(arr > 3.6) * 100:.2f}%")
+                st.plotly_chart(fig_scatter, width="stretch")
+
+                st.markdown("#### Bar Chart of CGPA Categories")
+                # Reuse the counts from the single classification pass, showing
+                # only the categories that occur.
+                present = np.flatnonzero(category_counts)
+                fig_bar = go.Figure(
+                    data=go.Bar(
+                        x=[CATEGORY_LABELS[i] for i in present],
+                        y=category_counts[present],
+                        marker_color='teal'
+                    )
+                )
+                fig_bar.update_layout(
+                    xaxis_title="CGPA Category",
+                    yaxis_title="Count",
+                    template="plotly_white"
+                )
+                st.plotly_chart(fig_bar, width="stretch")
+
+            st.markdown("### Extended Statistical Summary of Final CGPAs")
+            if final_col.size:
+                stats = summarize_statistics(final_col)
+                if stats:
+                    # One markdown element for the whole summary instead of
+                    # one st.write message per line.
+                    summary_lines = [
+                        f"**Count**: {stats['count']}",
+                        f"**Mean**: {stats['mean']:.2f}",
+                        f"**Median**: {stats['median']:.2f}",
+                        f"**Std**: {stats['std']:.2f}",
+                        f"**Variance**: {stats['variance']:.2f}",
+                        f"**Min**: {stats['min']:.2f}",
+                        f"**Max**: {stats['max']:.2f}",
+                        f"**25th Percentile**: {stats['25th_percentile']:.2f}",
+                        f"**75th Percentile**: {stats['75th_percentile']:.2f}",
+                    ]
+                    if "95ci_lower" in stats and "95ci_upper" in stats:
+                        summary_lines.append(f"**95% CI**: ({stats['95ci_lower']:.2f}, {stats['95ci_upper']:.2f})")
+                    summary_lines.append(f"**P(CGPA > 3.5)**: {stats['p_above_3.5'] * 100:.2f}%")
+                    summary_lines.append(f"**P(CGPA > 3.6)**: {stats['p_above_3.6'] * 100:.2f}%")
+                    st.markdown("\n\n".join(summary_lines))
+                else:
+                    st.write("No statistics available.")
             else:
-                st.write("No statistics available.")
-        else:
-            st.write("No CGPAs to analyze.")
-
-        st.markdown("""
-        **Quick Recruiter Insights**:
-        - **Below 3.0**: Potential cutoffs for many companies.
-        - **3.0-3.5**: Decent zone—employers look at strong projects/internships.
-        - **3.5-3.6**: Competitive; advanced courses stand out.
-        - **3.6-3.8**: Dean's List territory—seek leadership/unique experiences.
-        - **3.8+**: Near-perfect—focus on real-world, R&D, or specialized achievements!
-        """)
+                st.write("No CGPAs to analyze.")
+
+            st.markdown("""
+            **Quick Recruiter Insights**:
+            - **Below 3.0**: Potential cutoffs for many companies.
+            - **3.0-3.5**: Decent zone—employers look at strong projects/internships.
+            - **3.5-3.6**: Competitive; advanced courses stand out.
+            - **3.6-3.8**: Dean's List territory—seek leadership/unique experiences.
+            - **3.8+**: Near-perfect—focus on real-world, R&D, or specialized achievements!
+            """)
 
     # ----------------------------------------------------------------
     # TAB 4: Distributions & Exports
     # ----------------------------------------------------------------
     with tabs[3]:
-        st.markdown("### Final CGPA Distributions")
-        table_data = []
-        final_values_only = []
-        for (p_name, var_idx, final_val, cat, job_prob, advice) in final_cgpas:
-            table_data.append([
-                p_name, var_idx, f"{final_val:.2f}",
-                f"{job_prob * 100:.1f}%", advice, cat
-            ])
-            final_values_only.append(final_val)
-
-        if final_values_only:
-            st.plotly_chart(create_histogram(final_values_only), use_container_width=True)
-            st.plotly_chart(create_box_plot(final_values_only), use_container_width=True)
-            st.plotly_chart(create_pie_chart(final_values_only), use_container_width=True)
-            st.plotly_chart(generate_category_distribution_bar(final_values_only), use_container_width=True)
-
-        st.markdown("### Export Simulation Results")
-        df_results = pd.DataFrame(table_data, columns=[
-            "Path", "Variation", "Final CGPA", "Job Prob(%)", "Advice", "Category"
-        ])
-        csv_data = df_results.to_csv(index=False).encode('utf-8')
-        st.download_button(
-            "Download CSV",
-            data=csv_data,
-            file_name="cgpa_simulation_results.csv",
-            mime="text/csv"
-        )
-
-        if st.button("Download as PDF"):
-            buffer = io.BytesIO()
-            c = canvas.Canvas(buffer)
-            c.setFont("Helvetica", 12)
-            c.drawString(100, 800, "CGPA Simulation Results")
-            y_pos = 770
-            for row in table_data:
-                line = f"{row[0]} Var {row[1]}: CGPA={row[2]}, Prob={row[3]}, {row[4]}, Category={row[5]}"
-                c.drawString(50, y_pos, line)
-                y_pos -= 20
-            c.save()
-            st.download_button(
-                "Download PDF",
-                data=buffer.getvalue(),
-                file_name="cgpa_simulation_results.pdf",
-                mime="application/pdf"
-            )
+        if tabs[3].open:
+            st.markdown("### Final CGPA Distributions")
+            if final_col.size:
+                st.plotly_chart(create_histogram(final_col), width="stretch")
+                st.plotly_chart(create_box_plot(final_col), width="stretch")
+                st.plotly_chart(create_pie_chart(final_col), width="stretch")
+                st.plotly_chart(generate_category_distribution_bar(category_counts), width="stretch")
+
+            st.markdown("### Export Simulation Results")
+            render_exports(df_results)
 
 if __name__ == "__main__":
     main()
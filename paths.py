@@ -1,119 +1,172 @@
+import zlib
+
 import numpy as np
 
+# Single-trajectory generators: one clamped walk of 'steps' CGPAs starting
+# at 'start', returned as a list. Each one runs its batched variant below
+# for a single trajectory, so a call is a handful of array operations
+# rather than a Python loop with a scalar random draw per semester. 'seed'
+# seeds a fresh numpy Generator; None draws fresh entropy.
+
+def _single_trajectory(batch_func, start, steps, seed):
+    return batch_func(start, steps, 1, np.random.default_rng(seed))[0].tolist()
+
 def generate_balanced_growth(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
-    for _ in range(1, steps):
-        nxt = traj[-1] + (0.05 * np.random.randn() + 0.06)
-        traj.append(min(max(2.0, nxt), 4.0))
-    return traj
+    return _single_trajectory(generate_balanced_growth_batch, start, steps, seed)
 
 def generate_high_achiever(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
-    for _ in range(1, steps):
-        nxt = traj[-1] + (0.10 * np.random.randn() + 0.09)
-        traj.append(min(max(2.0, nxt), 4.0))
-    return traj
+    return _single_trajectory(generate_high_achiever_batch, start, steps, seed)
 
 def generate_downfall_recovery(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
-    for i in range(1, steps):
-        nxt = traj[-1] - 0.1 * np.random.rand() if i < 4 else traj[-1] + 0.15 * np.random.rand()
-        traj.append(min(max(2.0, nxt), 4.0))
-    return traj
+    return _single_trajectory(generate_downfall_recovery_batch, start, steps, seed)
 
 def generate_up_down(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
-    for _ in range(1, steps):
-        direction = 1 if np.random.rand() > 0.5 else -1
-        nxt = traj[-1] + direction * (0.15 + 0.1 * np.random.rand())
-        traj.append(min(max(2.0, nxt), 4.0))
-    return traj
+    return _single_trajectory(generate_up_down_batch, start, steps, seed)
 
 def generate_perfectionist(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
-    for i in range(1, steps):
-        nxt = traj[-1] - 0.15 * np.random.rand() if i in [3, 6] else traj[-1] + (0.08 + 0.07 * np.random.rand())
-        traj.append(min(max(2.0, nxt), 4.0))
-    return traj
+    return _single_trajectory(generate_perfectionist_batch, start, steps, seed)
 
 def generate_consistent_improvement(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
-    for _ in range(1, steps):
-        nxt = traj[-1] + 0.07 + 0.02 * np.random.randn()
-        traj.append(min(max(2.0, nxt), 4.0))
-    return traj
+    return _single_trajectory(generate_consistent_improvement_batch, start, steps, seed)
 
 def generate_chaotic(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
-    for i in range(1, steps):
-        nxt = traj[-1] + (0.2 * np.random.randn()) + 0.05 * ((-1) ** i)
-        traj.append(min(max(2.0, nxt), 4.0))
-    return traj
+    return _single_trajectory(generate_chaotic_batch, start, steps, seed)
 
 def generate_late_bloomer(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
-    for i in range(1, steps):
-        nxt = traj[-1] - 0.02 * np.random.rand() if i < 5 else traj[-1] + 0.15 + 0.05 * np.random.rand()
-        traj.append(min(max(2.0, nxt), 4.0))
-    return traj
+    return _single_trajectory(generate_late_bloomer_batch, start, steps, seed)
 
 def generate_spike_plateau(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
-    for i in range(1, steps):
-        nxt = traj[-1] + 0.25 + 0.05 * np.random.randn() if 3 <= i <= 5 else traj[-1] + 0.02 * np.random.randn()
-        traj.append(min(max(2.0, nxt), 4.0))
-    return traj
+    return _single_trajectory(generate_spike_plateau_batch, start, steps, seed)
 
 def generate_senioritis(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
-    for i in range(1, steps):
-        nxt = traj[-1] + 0.08 + 0.02 * np.random.randn() if i < 7 else traj[-1] - (0.1 * np.random.rand())
-        traj.append(min(max(2.0, nxt), 4.0))
-    return traj
+    return _single_trajectory(generate_senioritis_batch, start, steps, seed)
 
 def generate_no_study(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
-    for _ in range(1, steps):
-        nxt = traj[-1] - (0.05 + 0.05 * np.random.rand())
-        traj.append(min(max(2.0, nxt), 4.0))
-    return traj
+    return _single_trajectory(generate_no_study_batch, start, steps, seed)
 
 def generate_burnout(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
-    for i in range(1, steps):
-        nxt = traj[-1] - (0.1 + 0.1 * np.random.rand()) if 3 <= i <= 5 else traj[-1] + (0.05 * np.random.randn())
-        traj.append(min(max(2.0, nxt), 4.0))
-    return traj
+    return _single_trajectory(generate_burnout_batch, start, steps, seed)
 
 def generate_triumph_over_adversity(start, steps=10, seed=None):
-    if seed is not None:
-        np.random.seed(seed)
-    traj = [start]
+    return _single_trajectory(generate_triumph_over_adversity_batch, start, steps, seed)
+
+# --------------------------------------------------------------------------
+# Batched variants: generate `n` trajectories at once as an (n, steps) array.
+# Each path draws all of its noise up front, variation-major, so trajectory
+# j depends only on the seed and j: adding variations leaves the existing
+# ones unchanged. The noise is transposed into a (steps, n) matrix of
+# per-semester deltas; _clamped_walk then applies them one semester
+# at a time, clamping to [2.0, 4.0] before the next delta is added. `rng` is
+# a numpy Generator.
+# --------------------------------------------------------------------------
+
+def _clamped_walk(start, deltas):
+    steps, n = deltas.shape
+    traj = np.empty((n, max(steps, 1)))
+    traj[:, 0] = start
     for i in range(1, steps):
-        nxt = traj[-1] - 0.05 * np.random.rand() if i < 4 else traj[-1] + 0.12 + 0.08 * np.random.rand()
-        traj.append(min(max(2.0, nxt), 4.0))
+        np.clip(traj[:, i - 1] + deltas[i], 2.0, 4.0, out=traj[:, i])
     return traj
+
+def _semester_index(steps):
+    return np.arange(steps)[:, None]
+
+def _second_stream(rng):
+    """
+    Independent Generator for a path's second kind of noise: a jumped copy
+    of rng's bit generator, leaving rng itself untouched. Take it before
+    drawing from rng. Drawing the second block from rng itself, after the
+    first (n, steps) block, would make every row depend on n.
+    """
+    return np.random.Generator(rng.bit_generator.jumped())
+
+def generate_balanced_growth_batch(start, steps, n, rng):
+    deltas = 0.05 * rng.standard_normal((n, steps)).T + 0.06
+    return _clamped_walk(start, deltas)
+
+def generate_high_achiever_batch(start, steps, n, rng):
+    deltas = 0.10 * rng.standard_normal((n, steps)).T + 0.09
+    return _clamped_walk(start, deltas)
+
+def generate_downfall_recovery_batch(start, steps, n, rng):
+    i = _semester_index(steps)
+    u = rng.random((n, steps)).T
+    deltas = np.where(i < 4, -0.1 * u, 0.15 * u)
+    return _clamped_walk(start, deltas)
+
+def generate_up_down_batch(start, steps, n, rng):
+    u = rng.random((n, 2, steps)).T
+    direction = np.where(u[:, 0] > 0.5, 1, -1)
+    deltas = direction * (0.15 + 0.1 * u[:, 1])
+    return _clamped_walk(start, deltas)
+
+def generate_perfectionist_batch(start, steps, n, rng):
+    i = _semester_index(steps)
+    u = rng.random((n, steps)).T
+    deltas = np.where((i == 3) | (i == 6), -0.15 * u, 0.08 + 0.07 * u)
+    return _clamped_walk(start, deltas)
+
+def generate_consistent_improvement_batch(start, steps, n, rng):
+    deltas = 0.07 + 0.02 * rng.standard_normal((n, steps)).T
+    return _clamped_walk(start, deltas)
+
+def generate_chaotic_batch(start, steps, n, rng):
+    i = _semester_index(steps)
+    deltas = 0.2 * rng.standard_normal((n, steps)).T + 0.05 * (-1.0) ** i
+    return _clamped_walk(start, deltas)
+
+def generate_late_bloomer_batch(start, steps, n, rng):
+    i = _semester_index(steps)
+    u = rng.random((n, steps)).T
+    deltas = np.where(i < 5, -0.02 * u, 0.15 + 0.05 * u)
+    return _clamped_walk(start, deltas)
+
+def generate_spike_plateau_batch(start, steps, n, rng):
+    i = _semester_index(steps)
+    z = rng.standard_normal((n, steps)).T
+    deltas = np.where((3 <= i) & (i <= 5), 0.25 + 0.05 * z, 0.02 * z)
+    return _clamped_walk(start, deltas)
+
+def generate_senioritis_batch(start, steps, n, rng):
+    i = _semester_index(steps)
+    u_rng = _second_stream(rng)
+    z = rng.standard_normal((n, steps)).T
+    u = u_rng.random((n, steps)).T
+    deltas = np.where(i < 7, 0.08 + 0.02 * z, -0.1 * u)
+    return _clamped_walk(start, deltas)
+
+def generate_no_study_batch(start, steps, n, rng):
+    deltas = -(0.05 + 0.05 * rng.random((n, steps)).T)
+    return _clamped_walk(start, deltas)
+
+def generate_burnout_batch(start, steps, n, rng):
+    i = _semester_index(steps)
+    u_rng = _second_stream(rng)
+    z = rng.standard_normal((n, steps)).T
+    u = u_rng.random((n, steps)).T
+    deltas = np.where((3 <= i) & (i <= 5), -(0.1 + 0.1 * u), 0.05 * z)
+    return _clamped_walk(start, deltas)
+
+def generate_triumph_over_adversity_batch(start, steps, n, rng):
+    i = _semester_index(steps)
+    u = rng.random((n, steps)).T
+    deltas = np.where(i < 4, -0.05 * u, 0.12 + 0.08 * u)
+    return _clamped_walk(start, deltas)
+
+# --------------------------------------------------------------------------
+# One independent seed per path, shared by the Streamlit app and the CLI.
+# Derived from a fixed root and a CRC of the path name: unlike hash(), which
+# is salted per interpreter, these give the same trajectories on every run,
+# and keying on the name rather than list position means reordering or
+# adding paths leaves existing streams alone.
+# --------------------------------------------------------------------------
+ALL_PATHS = [
+    "Balanced Growth", "High Achiever", "Downfall & Recovery", "Up & Down",
+    "Perfectionist", "Consistent Improve", "Chaotic", "Late Bloomer",
+    "Spike Plateau", "Senioritis", "No Study", "Burnout", "Triumph Over Adversity"
+]
+
+PATH_SEEDS = {
+    name: np.random.SeedSequence([42, zlib.crc32(name.encode())])
+    for name in ALL_PATHS
+}
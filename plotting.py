@@ -1,21 +1,79 @@
 # plotting.py
 import plotly.graph_objects as go
 import numpy as np
+from functools import lru_cache
+
+# Above this many points a line trace is drawn with WebGL (Scattergl);
+# SVG scatter traces get sluggish in the browser past a few thousand.
+WEBGL_POINT_THRESHOLD = 2000
+
+# Paths with more variations than this are drawn as bare lines: no markers
+# and no per-point hover data, which at that density nobody can read anyway.
+DETAIL_VARIATION_LIMIT = 50
+
+# Point-level charts (violin, scatter, box points) draw at most this many
+# final CGPAs; above it the violin and scatter show a fixed random sample
+# and the box plot is drawn from precomputed quartiles.
+PLOT_SAMPLE_LIMIT = 5000
+
+def scatter_trace_class(n_points):
+    """go.Scattergl for large series, go.Scatter otherwise."""
+    return go.Scattergl if n_points > WEBGL_POINT_THRESHOLD else go.Scatter
+
+@lru_cache(maxsize=128)
+def hex_to_rgb(hex_color):
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+
+def join_with_gaps(rows):
+    """
+    Flatten an (n, k) array of line series into one series with NaN between
+    rows, so n separate lines can be drawn as a single Plotly trace.
+    """
+    rows = np.asarray(rows, dtype=float)
+    padded = np.full((rows.shape[0], rows.shape[1] + 1), np.nan)
+    padded[:, :-1] = rows
+    return padded.ravel()[:-1]
+
+def sample_indices(n, limit=PLOT_SAMPLE_LIMIT):
+    """
+    Sorted indices of a reproducible random sample of at most 'limit' out
+    of 'n' points, or a full slice when everything fits.
+    """
+    if n <= limit:
+        return slice(None)
+    return np.sort(np.random.default_rng(0).choice(n, limit, replace=False))
 
 def create_histogram(final_values):
-    fig = go.Figure(go.Histogram(x=final_values, nbinsx=10, marker_color='lightskyblue'))
+    # Binned here so only the bar heights are sent to the browser.
+    counts, edges = np.histogram(final_values, bins=10)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+                           marker_color='lightskyblue'))
     fig.update_layout(title="Histogram of Final CGPAs", xaxis_title="Final CGPA", yaxis_title="Count")
     return fig
 
 def create_box_plot(final_values):
-    fig = go.Figure(go.Box(y=final_values, name="Final CGPAs", boxpoints="all", jitter=0.5, marker_color="indianred"))
+    arr = np.asarray(final_values, dtype=float)
+    if arr.size <= PLOT_SAMPLE_LIMIT:
+        box = go.Box(y=arr, name="Final CGPAs", boxpoints="all", jitter=0.5, marker_color="indianred")
+    else:
+        # Quartiles and Tukey fences are computed over every value here, so
+        # the browser gets five numbers instead of every final CGPA.
+        q1, median, q3 = np.quantile(arr, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        lower_fence = arr[arr >= q1 - 1.5 * iqr].min()
+        upper_fence = arr[arr <= q3 + 1.5 * iqr].max()
+        box = go.Box(x=["Final CGPAs"], q1=[q1], median=[median], q3=[q3],
+                     lowerfence=[lower_fence], upperfence=[upper_fence],
+                     name="Final CGPAs", marker_color="indianred")
+    fig = go.Figure(box)
     fig.update_layout(title="Box Plot of Final CGPAs")
     return fig
 
 def create_pie_chart(final_values):
-    arr = np.array(final_values)
-    success_count = np.sum(arr >= 3.0)
-    struggle_count = len(arr) - success_count
+    arr = np.asarray(final_values)
+    success_count = int(np.count_nonzero(arr >= 3.0))
+    struggle_count = arr.size - success_count
     fig = go.Figure(go.Pie(labels=["CGPA≥3.0", "CGPA<3.0"], values=[success_count, struggle_count], hole=0.4))
     fig.update_layout(title="CGPA≥3.0 vs. CGPA<3.0")
     return fig
@@ -1,53 +1,125 @@
 # simulation.py
-import seaborn as sns
 import plotly.graph_objects as go
 from rich.console import Console
 from rich.table import Table
 from rich import box
 import numpy as np
+import re
+from functools import lru_cache
 
 from paths import (
-    generate_balanced_growth, generate_high_achiever, generate_downfall_recovery,
-    generate_up_down, generate_perfectionist, generate_consistent_improvement,
-    generate_chaotic, generate_late_bloomer, generate_spike_plateau, generate_senioritis,
-    generate_no_study, generate_burnout, generate_triumph_over_adversity
+    ALL_PATHS, PATH_SEEDS,
+    generate_balanced_growth_batch, generate_high_achiever_batch, generate_downfall_recovery_batch,
+    generate_up_down_batch, generate_perfectionist_batch, generate_consistent_improvement_batch,
+    generate_chaotic_batch, generate_late_bloomer_batch, generate_spike_plateau_batch,
+    generate_senioritis_batch, generate_no_study_batch, generate_burnout_batch,
+    generate_triumph_over_adversity_batch
 )
+from plotting import join_with_gaps, scatter_trace_class, DETAIL_VARIATION_LIMIT
 
 console = Console()
 
-def main():
-    sns.set_theme(style="darkgrid")
-    ascii_art = r"""
+PATH_STYLES = {
+    "Balanced Growth":        {"func": generate_balanced_growth_batch,        "color": "blue",      "marker": "circle"},
+    "High Achiever":          {"func": generate_high_achiever_batch,          "color": "green",     "marker": "circle"},
+    "Downfall & Recovery":    {"func": generate_downfall_recovery_batch,      "color": "red",       "marker": "circle"},
+    "Up & Down":              {"func": generate_up_down_batch,                "color": "orange",    "marker": "circle"},
+    "Perfectionist":          {"func": generate_perfectionist_batch,          "color": "purple",    "marker": "circle"},
+    "Consistent Improve":     {"func": generate_consistent_improvement_batch, "color": "cyan",      "marker": "circle"},
+    "Chaotic":                {"func": generate_chaotic_batch,                "color": "magenta",   "marker": "circle"},
+    "Late Bloomer":           {"func": generate_late_bloomer_batch,           "color": "darkblue",  "marker": "circle"},
+    "Spike Plateau":          {"func": generate_spike_plateau_batch,          "color": "lime",      "marker": "circle"},
+    "Senioritis":             {"func": generate_senioritis_batch,             "color": "brown",     "marker": "circle"},
+    "No Study":               {"func": generate_no_study_batch,               "color": "black",     "marker": "circle"},
+    "Burnout":                {"func": generate_burnout_batch,                "color": "goldenrod", "marker": "circle"},
+    "Triumph Over Adversity": {"func": generate_triumph_over_adversity_batch, "color": "teal",      "marker": "circle"}
+}
+
+@lru_cache(maxsize=64)
+def simulate_path(path_name, start, steps, n):
+    """
+    Every variation of one path as a read-only (n, steps) array.
+    Memoized on the inputs, so calling main() again with the same CGPA,
+    semester and variation count reuses the trajectories of paths it has
+    already generated; seeding per path keeps the result identical anyway.
+    """
+    rng = np.random.default_rng(PATH_SEEDS[path_name])
+    trajectories = PATH_STYLES[path_name]["func"](start, steps, n, rng)
+    trajectories.flags.writeable = False
+    return trajectories
+
+# Final-CGPA advice bands; upper bounds are exclusive, so a single
+# searchsorted over every outcome picks the message for each row.
+ADVICE_BINS = np.array([3.0, 3.5, 3.6, 3.8])
+CATEGORY_ADVICE = (
+    "Below 3.0: Could face interview filters.\n"
+    "Tip: Boost fundamentals + real-world projects.",
+    "3.0-3.5: Safe for many roles.\n"
+    "Tip: Strong projects/internships can stand out.",
+    "3.5-3.6: You stand out.\n"
+    "Tip: Aim for advanced courses or certifications.",
+    "3.6-3.8: Dean's List territory.\n"
+    "Tip: Leadership roles, hackathons, or research.",
+    "3.8-4.0: Near perfection!\n"
+    "Tip: Expand to open-source or specialized R&D.",
+)
+
+# Accepted shapes of the numeric prompts, checked before converting so
+# invalid input is rejected without raising and catching a ValueError.
+INT_INPUT = re.compile(r"^\s*\d+\s*$")
+FLOAT_INPUT = re.compile(r"^\s*(?:\d+(?:\.\d*)?|\.\d+)\s*$")
+
+# Fixed console text, parsed for markup and highlighted once at import
+# rather than on every main() call.
+ASCII_ART = console.render_str(r"""
      __  __ ___ ___ _  _   ___  _   _ ___  ___ 
     |  \/  |_ _/ __| || | / _ \| | | | _ \/ __|
     | |\/| || |\__ \ __ |( (_) ) |_| |  _/\__ \
     |_|  |_|___|___/_||_| \___/ \___/|_|  |___/
-    """
+    """)
+RECRUITER_INSIGHTS = console.render_str("""
+[bold cyan]Quick Recruiter Insights:[/]
+- [yellow]Below 3.0[/]: Some companies or roles may have a cutoff.
+- [yellow]3.0 to 3.5[/]: Comfortable baseline for many mainstream applications.
+- [yellow]3.5 to 3.6[/]: Strong contender; you’ll attract solid interest.
+- [yellow]3.6 to 3.8+[/]: Dean's List territory, appealing to highly selective employers.
+- [yellow]3.8+[/]: Near-perfect academically—balance with real-world projects too!
+
+[bold magenta]Remember:[/bold magenta] CGPA isn’t everything! Practical skills, projects, internships,
+and your personal spark can tip the scales in your favor.
+
+[bold green]Potential Next Steps:[/]
+1. [underline]Skill-based Quizzes[/] to refine trajectory: e.g., choose between Netflix or finishing assignments.
+2. [underline]Project Recommendations[/] to boost profile if CGPA dips or to complement a 3.8+.
+3. [underline]Export Results[/] for academic counseling or further analysis.
+4. [underline]Machine Learning Integration[/] for data-driven predictions using real grade logs.
+""")
+ASCII_FAREWELL = console.render_str(r"""
+    ______________________________________________
+   |                                              |
+   |   Simulation complete! May your CGPA dreams  |
+   |   come true across these parallel universes, |
+   |   Boss. Go forth and conquer those grades!   |
+   |______________________________________________|
+    """)
+
+def main():
     Boss = "Boss"
-    console.print(ascii_art, style="bold cyan")
+    console.print(ASCII_ART, style="bold cyan")
     console.print(f"Greetings, {Boss}! Let's shape your CGPA multiverse with ultimate realism.\n",
                   style="bold magenta")
 
     # 2.1 Gather User Input
     while True:
         variations_input = console.input("[bold green]How many CGPA trajectories per path would you like to generate?[/] ")
-        try:
+        if INT_INPUT.match(variations_input):
             variations_per_path = int(variations_input)
-            if variations_per_path < 1:
-                raise ValueError
-            break
-        except ValueError:
-            console.print(f"[red]{Boss}, that input isn't valid. Please enter a positive integer.[/]\n")
-
-    all_paths = [
-        "Balanced Growth", "High Achiever", "Downfall & Recovery", "Up & Down",
-        "Perfectionist", "Consistent Improve", "Chaotic", "Late Bloomer",
-        "Spike Plateau", "Senioritis", "No Study",
-        "Burnout", "Triumph Over Adversity"
-    ]
+            if variations_per_path >= 1:
+                break
+        console.print(f"[red]{Boss}, that input isn't valid. Please enter a positive integer.[/]\n")
 
     console.print("\nWhich CGPA evolution paths would you like to explore?\n", style="bold yellow")
-    for i, p in enumerate(all_paths, start=1):
+    for i, p in enumerate(ALL_PATHS, start=1):
         console.print(f"  {i}. {p}", style="bold white")
 
     console.print("\nType the numbers of the paths you'd like, separated by spaces (e.g. '1 3 5').\n"
@@ -55,28 +127,26 @@ def main():
     selection_input = console.input("[bold green]Your selection:[/] ")
 
     if selection_input.strip().lower() == "all":
-        selected_paths = all_paths
+        selected_paths = ALL_PATHS
         console.print(f"\nAlright, {Boss}, we’ll include ALL paths. Buckle up!\n", style="bold magenta")
     else:
         try:
             indices = [int(num) for num in selection_input.split()]
-            selected_paths = [all_paths[i - 1] for i in indices if 1 <= i <= len(all_paths)]
+            selected_paths = [ALL_PATHS[i - 1] for i in indices if 1 <= i <= len(ALL_PATHS)]
             if not selected_paths:
                 console.print(f"\nNo valid selections, {Boss}. We'll default to all paths.\n", style="red")
-                selected_paths = all_paths
+                selected_paths = ALL_PATHS
         except Exception:
             console.print(f"\nWe couldn't process your selection, {Boss}. Defaulting to all paths.\n", style="red")
-            selected_paths = all_paths
+            selected_paths = ALL_PATHS
 
     while True:
         semester_input = console.input("[bold green]Which semester are you in right now (1-10)?[/] ")
-        try:
+        if INT_INPUT.match(semester_input):
             current_semester = int(semester_input)
-            if not (1 <= current_semester <= 10):
-                raise ValueError
-            break
-        except ValueError:
-            console.print(f"[red]{Boss}, that doesn't look like a valid semester number. Please try again.[/]\n")
+            if 1 <= current_semester <= 10:
+                break
+        console.print(f"[red]{Boss}, that doesn't look like a valid semester number. Please try again.[/]\n")
 
     if current_semester == 1:
         console.print(f"\n{Boss}, you're at the very start of your academic journey! The possibilities are endless.\n",
@@ -90,13 +160,11 @@ def main():
 
     while True:
         cgpa_input = console.input("[bold green]What's your current CGPA? (0.0 - 4.0)[/] ")
-        try:
+        if FLOAT_INPUT.match(cgpa_input):
             current_cgpa = float(cgpa_input)
-            if not (0.0 <= current_cgpa <= 4.0):
-                raise ValueError
-            break
-        except ValueError:
-            console.print(f"[red]{Boss}, CGPA must be between 0.0 and 4.0. Try again.[/]\n")
+            if 0.0 <= current_cgpa <= 4.0:
+                break
+        console.print(f"[red]{Boss}, CGPA must be between 0.0 and 4.0. Try again.[/]\n")
 
     if current_cgpa < 2.0:
         console.print(f"\n** Warning, {Boss} **: A CGPA below 2.0 can lead to academic probation. Time to hustle!\n",
@@ -108,23 +176,10 @@ def main():
         console.print(f"\nSolid CGPA, {Boss}. Let’s see if you can climb higher (or maintain the momentum)!\n",
                       style="bold white")
 
-    path_styles = {
-        "Balanced Growth":        {"func": generate_balanced_growth,        "color": "blue",      "marker": "circle"},
-        "High Achiever":          {"func": generate_high_achiever,          "color": "green",     "marker": "circle"},
-        "Downfall & Recovery":    {"func": generate_downfall_recovery,      "color": "red",       "marker": "circle"},
-        "Up & Down":              {"func": generate_up_down,                "color": "orange",    "marker": "circle"},
-        "Perfectionist":          {"func": generate_perfectionist,          "color": "purple",    "marker": "circle"},
-        "Consistent Improve":     {"func": generate_consistent_improvement, "color": "cyan",      "marker": "circle"},
-        "Chaotic":                {"func": generate_chaotic,                "color": "magenta",   "marker": "circle"},
-        "Late Bloomer":           {"func": generate_late_bloomer,           "color": "darkblue",  "marker": "circle"},
-        "Spike Plateau":          {"func": generate_spike_plateau,          "color": "lime",      "marker": "circle"},
-        "Senioritis":             {"func": generate_senioritis,             "color": "brown",     "marker": "circle"},
-        "No Study":               {"func": generate_no_study,               "color": "black",     "marker": "circle"},
-        "Burnout":                {"func": generate_burnout,                "color": "goldenrod", "marker": "circle"},
-        "Triumph Over Adversity": {"func": generate_triumph_over_adversity, "color": "teal",      "marker": "circle"}
-    }
-
-    selected_path_data = {p: path_styles[p] for p in selected_paths}
+    # (path, color, marker) for each selected path, duplicates dropped, so the
+    # loop below unpacks its style without dict lookups.
+    selected_plan = [(p, PATH_STYLES[p]["color"], PATH_STYLES[p]["marker"])
+                     for p in dict.fromkeys(selected_paths)]
 
     if current_semester >= 10:
         steps = 1
@@ -136,48 +191,65 @@ def main():
     console.print(f"Alright, plotting from semester {current_semester} through semester {current_semester + steps - 1}...\n",
                   style="bold yellow")
 
-    fig = go.Figure()
-    final_cgpas = []
-
-    for path_name, style_info in selected_path_data.items():
-        func = style_info["func"]
-        color = style_info["color"]
-        marker = style_info["marker"]
-
-        for variation_index in range(variations_per_path):
-            seed_for_variation = (42 + hash(path_name) + variation_index) % (2**32)
-            trajectory = func(current_cgpa, steps=steps, seed=seed_for_variation)
-            final_cgpas.append((path_name, variation_index + 1, trajectory[-1]))
-
-            customdata = []
-            for idx, sem in enumerate(future_semesters):
-                if idx < len(trajectory)-1:
-                    customdata.append(f"{trajectory[idx+1]:.2f}")
-                else:
-                    customdata.append("N/A")
-
-            fig.add_trace(go.Scatter(
-                x=future_semesters,
-                y=trajectory,
-                customdata=customdata,
+    # Every path shares the same semesters and variation count, so the
+    # gap-separated x values of the line traces are built once.
+    line_x = join_with_gaps(np.tile(future_semesters, (variations_per_path, 1)))
+
+    traces = []
+    # Final outcomes, one slot per (path, variation), filled in loop order.
+    total = len(selected_plan) * variations_per_path
+    path_col = np.empty(total, dtype=object)
+    var_col = np.empty(total, dtype=np.int32)
+    final_col = np.empty(total)
+    k = 0
+
+    for path_name, color, marker in selected_plan:
+        # Every variation of the path in one batched call.
+        trajectories = simulate_path(path_name, current_cgpa, steps, variations_per_path)
+
+        path_col[k:k + variations_per_path] = path_name
+        var_col[k:k + variations_per_path] = np.arange(1, variations_per_path + 1)
+        final_col[k:k + variations_per_path] = trajectories[:, -1]
+        k += variations_per_path
+
+        if variations_per_path <= DETAIL_VARIATION_LIMIT:
+            # Hover shows the next semester's CGPA; the last point has none. The
+            # extra blank column lines up with the NaN gap between variations.
+            next_cgpa = np.full((variations_per_path, steps + 1), "", dtype=object)
+            next_cgpa[:, :steps - 1] = np.char.mod("%.2f", trajectories[:, 1:])
+            next_cgpa[:, steps - 1] = "N/A"
+            detail = dict(
                 mode='lines+markers',
-                name=f"{path_name} Var {variation_index+1}" if variation_index == 0 else None,
-                line=dict(color=color),
                 marker=dict(symbol=marker),
-                opacity=0.6,
+                customdata=next_cgpa.ravel()[:-1],
                 hovertemplate=(
                     "Semester: %{x}<br>"
                     "CGPA: %{y:.2f}<br>"
                     "Expected Next CGPA: %{customdata}<extra>%{fullData.name}</extra>"
                 )
-            ))
-
-    fig.update_layout(
+            )
+        else:
+            detail = dict(
+                mode='lines',
+                hovertemplate="Semester: %{x}<br>CGPA: %{y:.2f}<extra>%{fullData.name}</extra>"
+            )
+
+        # One trace per path, variations separated by NaN gaps.
+        traces.append(scatter_trace_class(trajectories.size)(
+            x=line_x,
+            y=join_with_gaps(trajectories),
+            name=path_name,
+            line=dict(color=color),
+            opacity=0.6,
+            **detail
+        ))
+
+    fig = go.Figure(data=traces, layout=dict(
         title="The Ultimate CGPA Multiverse",
         xaxis_title="Semester",
         yaxis_title="Cumulative CGPA",
         hovermode="closest"
-    )
+    ))
     fig.add_hline(y=3.6, line_dash="dash", line_color="gray",
                   annotation_text="Dean's List (3.6)", annotation_position="bottom right")
     fig.show()
@@ -189,59 +261,19 @@ def main():
     table.add_column("Final CGPA", justify="center", style="bold yellow")
     table.add_column("Category & Advice", justify="left", style="bold magenta")
 
-    for path_name, variation_num, final_cg in final_cgpas:
-        if final_cg < 3.0:
-            category_msg = ("Below 3.0: Could face interview filters.\n"
-                            "Tip: Boost fundamentals + real-world projects.")
-        elif final_cg < 3.5:
-            category_msg = ("3.0-3.5: Safe for many roles.\n"
-                            "Tip: Strong projects/internships can stand out.")
-        elif final_cg < 3.6:
-            category_msg = ("3.5-3.6: You stand out.\n"
-                            "Tip: Aim for advanced courses or certifications.")
-        elif final_cg < 3.8:
-            category_msg = ("3.6-3.8: Dean's List territory.\n"
-                            "Tip: Leadership roles, hackathons, or research.")
-        else:
-            category_msg = ("3.8-4.0: Near perfection!\n"
-                            "Tip: Expand to open-source or specialized R&D.")
-
-        table.add_row(
-            path_name,
-            str(variation_num),
-            f"{final_cg:.2f}",
-            category_msg
-        )
+    advice_col = np.searchsorted(ADVICE_BINS, final_col, side='right')
+    # Cell text for the numeric columns is formatted in bulk, once.
+    var_text = var_col.astype(str).tolist()
+    final_text = np.char.mod("%.2f", final_col).tolist()
+    for path_name, variation_num, final_cg, advice_idx in zip(
+            path_col, var_text, final_text, advice_col.tolist()):
+        table.add_row(path_name, variation_num, final_cg, CATEGORY_ADVICE[advice_idx])
 
     console.print(table)
 
-    console.print("""
-[bold cyan]Quick Recruiter Insights:[/]
-- [yellow]Below 3.0[/]: Some companies or roles may have a cutoff.
-- [yellow]3.0 to 3.5[/]: Comfortable baseline for many mainstream applications.
-- [yellow]3.5 to 3.6[/]: Strong contender; you’ll attract solid interest.
-- [yellow]3.6 to 3.8+[/]: Dean's List territory, appealing to highly selective employers.
-- [yellow]3.8+[/]: Near-perfect academically—balance with real-world projects too!
+    console.print(RECRUITER_INSIGHTS, style="bold white")
 
-[bold magenta]Remember:[/bold magenta] CGPA isn’t everything! Practical skills, projects, internships,
-and your personal spark can tip the scales in your favor.
-
-[bold green]Potential Next Steps:[/]
-1. [underline]Skill-based Quizzes[/] to refine trajectory: e.g., choose between Netflix or finishing assignments.
-2. [underline]Project Recommendations[/] to boost profile if CGPA dips or to complement a 3.8+.
-3. [underline]Export Results[/] for academic counseling or further analysis.
-4. [underline]Machine Learning Integration[/] for data-driven predictions using real grade logs.
-""", style="bold white")
-
-    ascii_farewell = r"""
-    ______________________________________________
-   |                                              |
-   |   Simulation complete! May your CGPA dreams  |
-   |   come true across these parallel universes, |
-   |   Boss. Go forth and conquer those grades!   |
-   |______________________________________________|
-    """
-    console.print(ascii_farewell, style="bold cyan")
+    console.print(ASCII_FAREWELL, style="bold cyan")
 
 
 if __name__ == "__main__":